@@ -1,3 +1,5 @@
+from collections.abc import Sequence
+
 from sqlalchemy.orm import Session
 
 from danswer.db.models import SlackBotConfig
@@ -12,12 +14,17 @@ VALID_SLACK_FILTERS = [
 
 
 def get_slack_bot_config_for_channel(
-    channel_name: str | None, db_session: Session
+    channel_name: str | None,
+    db_session: Session,
+    slack_bot_configs: Sequence[SlackBotConfig] | None = None,
 ) -> SlackBotConfig | None:
+    """Pass in `slack_bot_configs` if they have already been fetched to avoid
+    querying for them again"""
     if not channel_name:
         return None
 
-    slack_bot_configs = fetch_slack_bot_configs(db_session=db_session)
+    if slack_bot_configs is None:
+        slack_bot_configs = fetch_slack_bot_configs(db_session=db_session)
     for config in slack_bot_configs:
         if channel_name in config.channel_config["channel_names"]:
             return config
@@ -1,7 +1,10 @@
 import logging
+import random
+import time
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
 from typing import cast
 
-from retry import retry
 from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
 from sqlalchemy.orm import Session
@@ -11,8 +14,9 @@ from danswer.bots.slack.blocks import build_qa_response_blocks
 from danswer.bots.slack.blocks import get_restate_blocks
 from danswer.bots.slack.constants import SLACK_CHANNEL_ID
 from danswer.bots.slack.models import SlackMessageInfo
+from danswer.bots.slack.semantic_cache import get_slack_qa_cache
 from danswer.bots.slack.utils import ChannelIdAdapter
-from danswer.bots.slack.utils import fetch_userids_from_emails
+from danswer.bots.slack.utils import fetch_userids_from_emails_cached
 from danswer.bots.slack.utils import respond_in_thread
 from danswer.configs.app_configs import DOCUMENT_INDEX_NAME
 from danswer.configs.danswerbot_configs import DANSWER_BOT_ANSWER_GENERATION_TIMEOUT
@@ -21,11 +25,14 @@ from danswer.configs.danswerbot_configs import DANSWER_BOT_DISPLAY_ERROR_MSGS
 from danswer.configs.danswerbot_configs import DANSWER_BOT_NUM_RETRIES
 from danswer.configs.danswerbot_configs import DANSWER_REACT_EMOJI
 from danswer.configs.danswerbot_configs import DISABLE_DANSWER_BOT_FILTER_DETECT
+from danswer.configs.danswerbot_configs import ENABLE_DANSWERBOT_QA_CACHE
 from danswer.configs.danswerbot_configs import ENABLE_DANSWERBOT_REFLEXION
-from danswer.connectors.slack.utils import make_slack_api_rate_limited
 from danswer.db.engine import get_sqlalchemy_engine
+from danswer.db.feedback import create_query_event
 from danswer.db.models import SlackBotConfig
 from danswer.direct_qa.answer_question import answer_qa_query
+from danswer.search.models import SearchType
+from danswer.search.semantic_search import embed_query
 from danswer.server.models import QAResponse
 from danswer.server.models import QuestionRequest
 from danswer.server.models import RequestFilters
@@ -33,8 +40,19 @@ from danswer.utils.logger import setup_logger
 
 logger_base = setup_logger()
 
+# Backoff parameters for retrying answer generation, see `_get_answer` below
+_RETRY_BASE_DELAY_SECONDS = 0.25
+_RETRY_MAX_DELAY_SECONDS = 30.0
 
-def send_msg_ack_to_user(details: SlackMessageInfo, client: WebClient) -> None:
+# Reactions are only there to show that DanswerBot is working on the message, so they
+# are sent from here rather than blocking answer generation on the Slack API calls
+_REACTION_EXECUTOR = ThreadPoolExecutor(max_workers=4)
+
+
+def send_msg_ack_to_user(
+    details: SlackMessageInfo, client: WebClient
+) -> Future[None] | None:
+    """Returns the Future of the reaction if one is being added in the background"""
     if details.is_bot_msg and details.sender:
         respond_in_thread(
             client=client,
@@ -43,26 +61,55 @@ def send_msg_ack_to_user(details: SlackMessageInfo, client: WebClient) -> None:
             receiver_ids=[details.sender],
             text="Hi, we're evaluating your query :face_with_monocle:",
         )
-        return
+        return None
 
-    slack_call = make_slack_api_rate_limited(client.reactions_add)
-    slack_call(
-        name=DANSWER_REACT_EMOJI,
-        channel=details.channel_to_respond,
-        timestamp=details.msg_to_respond,
-    )
+    def _add_react() -> None:
+        client.reactions_add(
+            name=DANSWER_REACT_EMOJI,
+            channel=details.channel_to_respond,
+            # only bot messages (handled above) have no message to respond to
+            timestamp=cast(str, details.msg_to_respond),
+        )
+
+    return _REACTION_EXECUTOR.submit(_add_react)
 
 
-def remove_react(details: SlackMessageInfo, client: WebClient) -> None:
+def remove_react(
+    details: SlackMessageInfo,
+    client: WebClient,
+    add_react_future: Future[None] | None = None,
+) -> Future[None] | None:
+    """Removes the reaction in the background once it has been added (if the Future
+    for adding it is passed in). Returns the Future of the removal"""
     if details.is_bot_msg:
+        return None
+
+    def _remove_react() -> None:
+        # Nothing to remove if adding the reaction failed
+        if add_react_future is not None and add_react_future.exception() is not None:
+            return
+
+        client.reactions_remove(
+            name=DANSWER_REACT_EMOJI,
+            channel=details.channel_to_respond,
+            timestamp=details.msg_to_respond,
+        )
+
+    return _REACTION_EXECUTOR.submit(_remove_react)
+
+
+def _log_if_failed(
+    future: Future[None] | None, msg: str, logger: logging.Logger
+) -> None:
+    if future is None:
         return
 
-    slack_call = make_slack_api_rate_limited(client.reactions_remove)
-    slack_call(
-        name=DANSWER_REACT_EMOJI,
-        channel=details.channel_to_respond,
-        timestamp=details.msg_to_respond,
-    )
+    def _callback(done_future: Future[None]) -> None:
+        e = done_future.exception()
+        if e is not None:
+            logger.error(f"{msg} due to: {e}")
+
+    future.add_done_callback(_callback)
 
 
 def handle_message(
@@ -75,6 +122,7 @@ def handle_message(
     disable_docs_only_answer: bool = DANSWER_BOT_DISABLE_DOCS_ONLY_ANSWER,
     disable_auto_detect_filters: bool = DISABLE_DANSWER_BOT_FILTER_DETECT,
     reflexion: bool = ENABLE_DANSWERBOT_REFLEXION,
+    enable_qa_cache: bool = ENABLE_DANSWERBOT_QA_CACHE,
 ) -> bool:
     """Potentially respond to the user message depending on filters and if an answer was generated
 
@@ -136,7 +184,7 @@ def handle_message(
         return False
 
     if respond_team_member_list:
-        send_to = fetch_userids_from_emails(respond_team_member_list, client)
+        send_to = fetch_userids_from_emails_cached(respond_team_member_list, client)
 
     # If configured to respond to team members only, then cannot be used with a /DanswerBot command
     # which would just respond to the sender
@@ -150,19 +198,16 @@ def handle_message(
                 thread_ts=None,
             )
 
+    add_react_future: Future[None] | None = None
     try:
-        send_msg_ack_to_user(message_info, client)
+        add_react_future = send_msg_ack_to_user(message_info, client)
     except SlackApiError as e:
         logger.error(f"Was not able to react to user message due to: {e}")
+    _log_if_failed(add_react_future, "Was not able to react to user message", logger)
 
-    @retry(
-        tries=num_retries,
-        delay=0.25,
-        backoff=2,
-        logger=logger,
-    )
-    def _get_answer(question: QuestionRequest) -> QAResponse:
-        engine = get_sqlalchemy_engine()
+    engine = get_sqlalchemy_engine()
+
+    def _get_answer_once(question: QuestionRequest) -> QAResponse:
         with Session(engine, expire_on_commit=False) as db_session:
             # This also handles creating the query event in postgres
             answer = answer_qa_query(
@@ -178,6 +223,26 @@ def handle_message(
             else:
                 raise RuntimeError(answer.error_msg)
 
+    def _get_answer(question: QuestionRequest) -> QAResponse:
+        for attempt in range(num_retries):
+            try:
+                return _get_answer_once(question)
+            except ValueError:
+                # Invalid input, retrying will not help
+                raise
+            except Exception as e:
+                if attempt == num_retries - 1:
+                    raise
+                # Exponential backoff with "full jitter" so that many events failing
+                # at once don't all hit the LLM / document index again in lockstep
+                sleep_time = random.random() * min(
+                    _RETRY_MAX_DELAY_SECONDS, _RETRY_BASE_DELAY_SECONDS * 2**attempt
+                )
+                logger.warning(f"{e}, retrying in {sleep_time:.2f} seconds...")
+                time.sleep(sleep_time)
+
+        raise RuntimeError(f"Invalid number of retries: {num_retries}")
+
     answer_failed = False
     try:
         # By leaving time_cutoff and favor_recent as None, and setting enable_auto_detect_filters
@@ -188,18 +253,56 @@ def handle_message(
             time_cutoff=None,
         )
 
-        # This includes throwing out answer via reflexion
-        answer = _get_answer(
-            QuestionRequest(
-                query=msg,
-                collection=DOCUMENT_INDEX_NAME,
-                use_keyword=False,  # always use semantic search when handling Slack messages
-                enable_auto_detect_filters=not disable_auto_detect_filters,
-                filters=filters,
-                favor_recent=None,
-                offset=None,
-            )
+        # Answers are only reusable if they were generated over the same documents
+        # and went through the same filter detection / answer validity checks
+        cache_scope = (
+            tuple(sorted(document_set_names or [])),
+            reflexion,
+            disable_auto_detect_filters,
         )
+        query_embedding: list[float] | None = None
+        cached_answer: QAResponse | None = None
+        if enable_qa_cache:
+            query_embedding = embed_query(msg)
+            cached_answer = get_slack_qa_cache().get(query_embedding, cache_scope)
+
+        if cached_answer is not None:
+            logger.info("Found answer to a similar question in cache, reusing it")
+            # Feedback is recorded against the answer's query event, so this question
+            # needs its own event rather than the one of the question that was cached
+            with Session(engine, expire_on_commit=False) as db_session:
+                query_event_id = create_query_event(
+                    query=msg,
+                    selected_flow=SearchType.SEMANTIC,
+                    llm_answer=None,
+                    user_id=None,
+                    retrieved_document_ids=[
+                        doc.document_id for doc in cached_answer.top_ranked_docs or []
+                    ],
+                    db_session=db_session,
+                )
+            answer = cached_answer.copy(update={"query_event_id": query_event_id})
+        else:
+            # This includes throwing out answer via reflexion
+            answer = _get_answer(
+                QuestionRequest(
+                    query=msg,
+                    collection=DOCUMENT_INDEX_NAME,
+                    use_keyword=False,  # always use semantic search when handling Slack messages
+                    enable_auto_detect_filters=not disable_auto_detect_filters,
+                    filters=filters,
+                    favor_recent=None,
+                    offset=None,
+                )
+            )
+
+            # Only keep answers that would actually be shown to the user
+            if (
+                query_embedding is not None
+                and answer.eval_res_valid is not False
+                and answer.top_ranked_docs
+            ):
+                get_slack_qa_cache().put(query_embedding, cache_scope, answer)
     except Exception as e:
         answer_failed = True
         logger.exception(
@@ -217,10 +320,11 @@ def handle_message(
                 thread_ts=message_ts_to_respond_to,
             )
 
-    try:
-        remove_react(message_info, client)
-    except SlackApiError as e:
-        logger.error(f"Failed to remove Reaction due to: {e}")
+    _log_if_failed(
+        remove_react(message_info, client, add_react_future),
+        "Failed to remove Reaction",
+        logger,
+    )
 
     if answer_failed:
         return True
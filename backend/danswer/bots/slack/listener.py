@@ -3,7 +3,6 @@ import time
 from typing import Any
 from typing import cast
 
-from slack_sdk import WebClient
 from slack_sdk.socket_mode import SocketModeClient
 from slack_sdk.socket_mode.request import SocketModeRequest
 from slack_sdk.socket_mode.response import SocketModeResponse
@@ -15,19 +14,27 @@ from danswer.bots.slack.handlers.handle_feedback import handle_slack_feedback
 from danswer.bots.slack.handlers.handle_message import handle_message
 from danswer.bots.slack.models import SlackMessageInfo
 from danswer.bots.slack.tokens import fetch_tokens
+from danswer.bots.slack.utils import build_web_client
 from danswer.bots.slack.utils import ChannelIdAdapter
 from danswer.bots.slack.utils import decompose_block_id
-from danswer.bots.slack.utils import get_channel_name_from_id
+from danswer.bots.slack.utils import get_channel_name_from_id_cached
 from danswer.bots.slack.utils import respond_in_thread
 from danswer.configs.danswerbot_configs import DANSWER_BOT_RESPOND_EVERY_CHANNEL
 from danswer.configs.danswerbot_configs import NOTIFY_SLACKBOT_NO_ANSWER
 from danswer.db.engine import get_sqlalchemy_engine
+from danswer.db.slack_bot_config import fetch_slack_bot_configs
 from danswer.dynamic_configs.interface import ConfigNotFoundError
 from danswer.utils.logger import setup_logger
 
 
 logger = setup_logger()
 
+# Bot user id is static for the lifetime of the process, resolve it once instead of
+# making an `auth.test` call to Slack for every incoming event
+_BOT_USER_ID: str | None = None
+# Matches the @DanswerBot tag in messages, compiled once the bot user id is known
+_BOT_MENTION_PATTERN: re.Pattern[str] | None = None
+
 
 class MissingTokensException(Exception):
     pass
@@ -43,10 +50,26 @@ def _get_socket_client() -> SocketModeClient:
     return SocketModeClient(
         # This app-level token will be used only for establishing a connection
         app_token=slack_bot_tokens.app_token,
-        web_client=WebClient(token=slack_bot_tokens.bot_token),
+        web_client=build_web_client(slack_bot_tokens.bot_token),
     )
 
 
+def _get_bot_user_id(client: SocketModeClient) -> str | None:
+    global _BOT_USER_ID, _BOT_MENTION_PATTERN
+    if _BOT_USER_ID is None:
+        _BOT_USER_ID = client.web_client.auth_test().get("user_id")
+        if _BOT_USER_ID:
+            _BOT_MENTION_PATTERN = re.compile(rf"<@{re.escape(_BOT_USER_ID)}>\s+")
+    return _BOT_USER_ID
+
+
+def _remove_bot_mention(msg: str, client: SocketModeClient) -> str:
+    _get_bot_user_id(client)
+    if _BOT_MENTION_PATTERN is None:
+        return msg
+    return _BOT_MENTION_PATTERN.sub("", msg, count=1)
+
+
 def prefilter_requests(req: SocketModeRequest, client: SocketModeClient) -> bool:
     """True to keep going, False to ignore this Slack request"""
     if req.type == "events_api":
@@ -77,7 +100,7 @@ def prefilter_requests(req: SocketModeRequest, client: SocketModeClient) -> bool
             return False
 
         if event_type == "message":
-            bot_tag_id = client.web_client.auth_test().get("user_id")
+            bot_tag_id = _get_bot_user_id(client)
             # DMs with the bot don't pick up the @DanswerBot so we have to keep the
             # caught events_api
             if bot_tag_id and bot_tag_id in msg and event.get("channel_type") != "im":
@@ -170,10 +193,9 @@ def build_request_details(
         tagged = event.get("type") == "app_mention"
         message_ts = event.get("ts")
         thread_ts = event.get("thread_ts")
-        bot_tag_id = client.web_client.auth_test().get("user_id")
         # Might exist even if not tagged, specifically in the case of @DanswerBot
         # in DanswerBot DM channel
-        msg = re.sub(rf"<@{bot_tag_id}>\s", "", msg)
+        msg = _remove_bot_mention(msg, client)
 
         if tagged:
             logger.info("User tagged DanswerBot")
@@ -204,6 +226,13 @@ def build_request_details(
     raise RuntimeError("Programming fault, this should never happen.")
 
 
+def _get_event_channel_type(req: SocketModeRequest) -> str | None:
+    if req.type != "events_api":
+        return None
+    event = cast(dict[str, Any], req.payload.get("event", {}))
+    return cast(str | None, event.get("channel_type"))
+
+
 def apologize_for_fail(
     details: SlackMessageInfo,
     client: SocketModeClient,
@@ -230,14 +259,29 @@ def process_message(
 
     details = build_request_details(req, client)
     channel = details.channel_to_respond
-    channel_name, is_dm = get_channel_name_from_id(
-        client=client.web_client, channel_id=channel
-    )
 
     engine = get_sqlalchemy_engine()
     with Session(engine) as db_session:
+        slack_bot_configs = fetch_slack_bot_configs(db_session=db_session)
+
+        # If no channels are configured, the channel name can't match any config so
+        # skip fetching it from Slack for messages that would be thrown out anyway.
+        # Message events include the channel type, so DMs can be detected without it
+        if (
+            not slack_bot_configs
+            and not respond_every_channel
+            and not (details.is_bot_msg or details.bipass_filters)
+            and _get_event_channel_type(req) not in [None, "im", "mpim"]
+        ):
+            return
+
+        channel_name, is_dm = get_channel_name_from_id_cached(
+            client=client.web_client, channel_id=channel
+        )
         slack_bot_config = get_slack_bot_config_for_channel(
-            channel_name=channel_name, db_session=db_session
+            channel_name=channel_name,
+            db_session=db_session,
+            slack_bot_configs=slack_bot_configs,
         )
 
         # Be careful about this default, don't want to accidentally spam every channel
@@ -295,6 +339,8 @@ def process_slack_event(client: SocketModeClient, req: SocketModeRequest) -> Non
 if __name__ == "__main__":
     try:
         socket_client = _get_socket_client()
+        # Resolve the bot user id up front so the first event doesn't pay for it
+        _get_bot_user_id(socket_client)
         socket_client.socket_mode_request_listeners.append(process_slack_event)  # type: ignore
 
         # Establish a WebSocket connection to the Socket Mode servers
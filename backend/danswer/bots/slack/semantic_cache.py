@@ -0,0 +1,117 @@
+import threading
+import time
+from collections.abc import Hashable
+
+import numpy
+
+from danswer.configs.danswerbot_configs import DANSWER_BOT_QA_CACHE_MAX_SIZE
+from danswer.configs.danswerbot_configs import DANSWER_BOT_QA_CACHE_SIMILARITY
+from danswer.configs.danswerbot_configs import DANSWER_BOT_QA_CACHE_TTL_SECONDS
+from danswer.server.models import QAResponse
+
+
+class SlackQASemanticCache:
+    """In memory cache of answers keyed by the embedding of the question asked.
+
+    A lookup hits if a previously answered question within the same scope (e.g. the
+    document sets the channel is restricted to and the answer filters applied) has
+    a cosine similarity above the threshold. Entries expire after `ttl_seconds` and
+    the least recently used entry is evicted once `max_size` is reached.
+
+    All cached query embeddings live in a single (max_size, dim) matrix so a lookup
+    is one matrix-vector product rather than a Python loop over entries."""
+
+    def __init__(
+        self,
+        max_size: int = DANSWER_BOT_QA_CACHE_MAX_SIZE,
+        ttl_seconds: float = DANSWER_BOT_QA_CACHE_TTL_SECONDS,
+        similarity_threshold: float = DANSWER_BOT_QA_CACHE_SIMILARITY,
+    ) -> None:
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.similarity_threshold = similarity_threshold
+
+        self._lock = threading.Lock()
+        # Allocated on first insert, once the embedding dimension is known
+        self._embeddings: numpy.ndarray | None = None
+        self._responses: list[QAResponse | None] = [None] * max_size
+        self._scope_ids = numpy.full(max_size, -1, dtype=numpy.int64)
+        self._inserted_at = numpy.full(max_size, -numpy.inf)
+        self._last_used = numpy.full(max_size, -numpy.inf)
+        self._scope_to_id: dict[Hashable, int] = {}
+
+    @staticmethod
+    def _normalize(embedding: list[float]) -> numpy.ndarray:
+        vector = numpy.asarray(embedding, dtype=numpy.float32)
+        norm = numpy.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def _live_slots(self, now: float) -> numpy.ndarray:
+        return (now - self._inserted_at) < self.ttl_seconds
+
+    def get(self, query_embedding: list[float], scope: Hashable) -> QAResponse | None:
+        query = self._normalize(query_embedding)
+        with self._lock:
+            scope_id = self._scope_to_id.get(scope)
+            if (
+                scope_id is None
+                or self._embeddings is None
+                or self._embeddings.shape[1] != query.shape[0]
+            ):
+                return None
+
+            now = time.monotonic()
+            candidates = self._live_slots(now) & (self._scope_ids == scope_id)
+            if not candidates.any():
+                return None
+
+            scores = numpy.where(candidates, self._embeddings @ query, -numpy.inf)
+            best_slot = int(numpy.argmax(scores))
+            if scores[best_slot] < self.similarity_threshold:
+                return None
+
+            self._last_used[best_slot] = now
+            return self._responses[best_slot]
+
+    def put(
+        self,
+        query_embedding: list[float],
+        scope: Hashable,
+        response: QAResponse,
+    ) -> None:
+        query = self._normalize(query_embedding)
+        with self._lock:
+            if self._embeddings is None or self._embeddings.shape[1] != query.shape[0]:
+                # First insert or the embedding model changed, start fresh
+                self._embeddings = numpy.zeros(
+                    (self.max_size, query.shape[0]), dtype=numpy.float32
+                )
+                self._inserted_at.fill(-numpy.inf)
+                self._last_used.fill(-numpy.inf)
+
+            now = time.monotonic()
+            # Reuse an empty / expired slot if possible, otherwise evict the LRU entry
+            free_slots = ~self._live_slots(now)
+            slot = int(
+                numpy.argmax(free_slots)
+                if free_slots.any()
+                else numpy.argmin(self._last_used)
+            )
+
+            self._embeddings[slot] = query
+            self._responses[slot] = response
+            self._scope_ids[slot] = self._scope_to_id.setdefault(
+                scope, len(self._scope_to_id)
+            )
+            self._inserted_at[slot] = now
+            self._last_used[slot] = now
+
+
+_QA_CACHE: SlackQASemanticCache | None = None
+
+
+def get_slack_qa_cache() -> SlackQASemanticCache:
+    global _QA_CACHE
+    if _QA_CACHE is None:
+        _QA_CACHE = SlackQASemanticCache()
+    return _QA_CACHE
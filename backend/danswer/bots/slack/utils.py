@@ -2,13 +2,22 @@ import logging
 import random
 import re
 import string
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from collections.abc import Hashable
 from collections.abc import MutableMapping
 from typing import Any
 from typing import cast
+from typing import Generic
+from typing import TypeVar
 
 from retry import retry
 from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
+from slack_sdk.http_retry import ConnectionErrorRetryHandler
+from slack_sdk.http_retry import RateLimitErrorRetryHandler
 from slack_sdk.models.blocks import Block
 from slack_sdk.models.metadata import Metadata
 
@@ -16,13 +25,67 @@ from danswer.bots.slack.constants import SLACK_CHANNEL_ID
 from danswer.bots.slack.tokens import fetch_tokens
 from danswer.configs.constants import ID_SEPARATOR
 from danswer.configs.danswerbot_configs import DANSWER_BOT_NUM_RETRIES
-from danswer.connectors.slack.utils import make_slack_api_rate_limited
 from danswer.connectors.slack.utils import SlackTextCleaner
 from danswer.utils.logger import setup_logger
 from danswer.utils.text_processing import replace_whitespaces_w_space
 
 logger = setup_logger()
 
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class _TTLCache(Generic[K, V]):
+    """Thread safe cache where entries expire after `ttl_seconds` and the least
+    recently used entry is evicted once there are more than `max_size` entries"""
+
+    def __init__(self, max_size: int, ttl_seconds: float) -> None:
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[K, tuple[V, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_compute(
+        self,
+        key: K,
+        compute: Callable[[], V],
+        should_cache: Callable[[V], bool] | None = None,
+    ) -> V:
+        """Values are only cached if `should_cache` (when given) returns True for them,
+        exceptions raised by `compute` are propagated and nothing is cached"""
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                value, computed_at = cached
+                if time.monotonic() - computed_at < self.ttl_seconds:
+                    self._entries.move_to_end(key)
+                    return value
+                del self._entries[key]
+
+        # Don't hold the lock while computing, it generally means waiting on Slack
+        value = compute()
+        if should_cache is not None and not should_cache(value):
+            return value
+
+        with self._lock:
+            self._entries[key] = (value, time.monotonic())
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+        return value
+
+
+# Channel names rarely change, so avoid a `conversations.info` call per event
+# maps channel id -> (channel name, is dm)
+_channel_name_cache: _TTLCache[str, tuple[str | None, bool]] = _TTLCache(
+    max_size=512, ttl_seconds=600
+)
+# Avoid a `users.lookupByEmail` call per configured team member for every message
+_user_ids_from_emails_cache: _TTLCache[tuple[str, ...], list[str]] = _TTLCache(
+    max_size=128, ttl_seconds=3600
+)
+
 
 class ChannelIdAdapter(logging.LoggerAdapter):
     """This is used to add the channel ID to all log messages
@@ -38,9 +101,21 @@ class ChannelIdAdapter(logging.LoggerAdapter):
             return msg, kwargs
 
 
+def build_web_client(bot_token: str) -> WebClient:
+    # Have the client itself retry rate limited calls (respecting `Retry-After`) and
+    # connection errors, rather than wrapping every call individually
+    return WebClient(
+        token=bot_token,
+        retry_handlers=[
+            ConnectionErrorRetryHandler(),
+            RateLimitErrorRetryHandler(max_retry_count=3),
+        ],
+    )
+
+
 def get_web_client() -> WebClient:
     slack_tokens = fetch_tokens()
-    return WebClient(token=slack_tokens.bot_token)
+    return build_web_client(slack_tokens.bot_token)
 
 
 @retry(
@@ -63,12 +138,7 @@ def respond_in_thread(
         raise ValueError("One of `text` or `blocks` must be provided")
 
     if not receiver_ids:
-        slack_call = make_slack_api_rate_limited(client.chat_postMessage)
-    else:
-        slack_call = make_slack_api_rate_limited(client.chat_postEphemeral)
-
-    if not receiver_ids:
-        response = slack_call(
+        response = client.chat_postMessage(
             channel=channel,
             text=text,
             blocks=blocks,
@@ -81,7 +151,7 @@ def respond_in_thread(
             raise RuntimeError(f"Failed to post message: {response}")
     else:
         for receiver in receiver_ids:
-            response = slack_call(
+            response = client.chat_postEphemeral(
                 channel=channel,
                 user=receiver,
                 text=text,
@@ -185,6 +255,16 @@ def get_channel_name_from_id(
         raise e
 
 
+def get_channel_name_from_id_cached(
+    client: WebClient, channel_id: str
+) -> tuple[str | None, bool]:
+    """Same as `get_channel_name_from_id` but backed by a TTL + LRU cache"""
+    return _channel_name_cache.get_or_compute(
+        channel_id,
+        lambda: get_channel_name_from_id(client=client, channel_id=channel_id),
+    )
+
+
 def fetch_userids_from_emails(user_emails: list[str], client: WebClient) -> list[str]:
     user_ids: list[str] = []
     for email in user_emails:
@@ -201,3 +281,18 @@ def fetch_userids_from_emails(user_emails: list[str], client: WebClient) -> list
         )
 
     return user_ids
+
+
+def fetch_userids_from_emails_cached(
+    user_emails: list[str], client: WebClient
+) -> list[str]:
+    """Same as `fetch_userids_from_emails` but backed by a TTL + LRU cache"""
+    user_ids = _user_ids_from_emails_cache.get_or_compute(
+        tuple(sorted(user_emails)),
+        lambda: fetch_userids_from_emails(user_emails=user_emails, client=client),
+        # If some lookups failed (possibly transiently), don't keep those team
+        # members out of the loop until the entry expires
+        should_cache=lambda user_ids: len(user_ids) == len(user_emails),
+    )
+    # callers shouldn't be able to modify the cached list
+    return list(user_ids)
@@ -102,6 +102,11 @@ POSTGRES_PASSWORD = os.environ.get("POSTGRES_PASSWORD") or "password"
 POSTGRES_HOST = os.environ.get("POSTGRES_HOST") or "localhost"
 POSTGRES_PORT = os.environ.get("POSTGRES_PORT") or "5432"
 POSTGRES_DB = os.environ.get("POSTGRES_DB") or "postgres"
+# Connection pool settings for the sync engine, note that these are per process
+POSTGRES_POOL_SIZE = int(os.environ.get("POSTGRES_POOL_SIZE") or 10)
+POSTGRES_MAX_OVERFLOW = int(os.environ.get("POSTGRES_MAX_OVERFLOW") or 20)
+# Recycle connections before Postgres / proxies in between drop them for being idle
+POSTGRES_POOL_RECYCLE = int(os.environ.get("POSTGRES_POOL_RECYCLE") or 1800)
 
 
 #####
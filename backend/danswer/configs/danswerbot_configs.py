@@ -49,3 +49,20 @@ ENABLE_DANSWERBOT_REFLEXION = (
 ENABLE_SLACK_DOC_FEEDBACK = (
     os.environ.get("ENABLE_SLACK_DOC_FEEDBACK", "").lower() == "true"
 )
+# Reuse the answer of a recently asked, near identical question instead of running
+# retrieval + the LLM again. Off by default since the answer may be slightly stale.
+# NOTE: the lookup embeds the question, and on a cache miss retrieval embeds it again,
+# so enabling this costs an extra query embedding for every question not in the cache
+ENABLE_DANSWERBOT_QA_CACHE = (
+    os.environ.get("ENABLE_DANSWERBOT_QA_CACHE", "").lower() == "true"
+)
+DANSWER_BOT_QA_CACHE_MAX_SIZE = int(
+    os.environ.get("DANSWER_BOT_QA_CACHE_MAX_SIZE", "512")
+)
+DANSWER_BOT_QA_CACHE_TTL_SECONDS = int(
+    os.environ.get("DANSWER_BOT_QA_CACHE_TTL_SECONDS", "300")
+)
+# Minimum cosine similarity between two questions for them to be considered the same
+DANSWER_BOT_QA_CACHE_SIMILARITY = float(
+    os.environ.get("DANSWER_BOT_QA_CACHE_SIMILARITY", "0.95")
+)
@@ -29,7 +29,8 @@ SIM_SCORE_RANGE_HIGH = float(os.environ.get("SIM_SCORE_RANGE_HIGH") or 1.0)
 ASYM_QUERY_PREFIX = os.environ.get("ASYM_QUERY_PREFIX", "")
 ASYM_PASSAGE_PREFIX = os.environ.get("ASYM_PASSAGE_PREFIX", "")
 # Purely an optimization, memory limitation consideration
-BATCH_SIZE_ENCODE_CHUNKS = 8
+# Raising this (e.g. to 32-64) gives much better throughput when embedding on a GPU
+BATCH_SIZE_ENCODE_CHUNKS = int(os.environ.get("BATCH_SIZE_ENCODE_CHUNKS") or 8)
 # This controls the number of pytorch "threads" to allocate to the embedding
 # model. Specifically, this is computed as `num_cpu_cores - BACKGROUND_JOB_EMBEDDING_MODEL_CPU_CORES_LEFT_UNUSED`.
 # This is useful for limiting the number of CPU cores that the background job consumes to leave some
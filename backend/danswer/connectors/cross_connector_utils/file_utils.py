@@ -2,6 +2,7 @@ import json
 import os
 import zipfile
 from collections.abc import Generator
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 from typing import IO
@@ -16,30 +17,46 @@ logger = setup_logger()
 _METADATA_FLAG = "#DANSWER_METADATA="
 
 
-def read_pdf_file(file: IO[Any], file_name: str, pdf_pass: str | None = None) -> str:
+def read_pdf_file_pages(
+    file: IO[Any], file_name: str, pdf_pass: str | None = None
+) -> Iterator[str]:
+    """Yields the text of the PDF one page at a time so the full document text
+    never needs to be held in memory at once"""
     pdf_reader = PdfReader(file)
 
-    # if marked as encrypted and a password is provided, try to decrypt
-    if pdf_reader.is_encrypted and pdf_pass is not None:
+    # if marked as encrypted, try to decrypt. Without a password, try the empty
+    # one which works for files that only have an owner password set. If the file
+    # still can't be decrypted, bail out early since extracting text would fail
+    if pdf_reader.is_encrypted:
         decrypt_success = False
-        if pdf_pass is not None:
-            try:
-                decrypt_success = pdf_reader.decrypt(pdf_pass) != 0
-            except Exception:
-                logger.error(f"Unable to decrypt pdf {file_name}")
-        else:
-            logger.info(f"No Password available to to decrypt pdf {file_name}")
+        try:
+            decrypt_success = pdf_reader.decrypt(pdf_pass or "") != 0
+        except Exception:
+            logger.error(f"Unable to decrypt pdf {file_name}")
 
         if not decrypt_success:
+            if pdf_pass is None:
+                logger.info(f"No Password available to to decrypt pdf {file_name}")
             # By user request, keep files that are unreadable just so they
             # can be discoverable by title.
-            return ""
+            return
 
     try:
-        return "\n".join(page.extract_text() for page in pdf_reader.pages)
+        for page in pdf_reader.pages:
+            # some PDF libraries return None for pages without text
+            yield page.extract_text() or ""
     except Exception:
         logger.exception(f"Failed to read PDF {file_name}")
-        return ""
+
+
+def read_pdf_file(file: IO[Any], file_name: str, pdf_pass: str | None = None) -> str:
+    return "\n".join(
+        page_text
+        for page_text in read_pdf_file_pages(
+            file=file, file_name=file_name, pdf_pass=pdf_pass
+        )
+        if page_text
+    )
 
 
 def is_macos_resource_fork_file(file_name: str) -> bool:
@@ -55,20 +72,22 @@ def load_files_from_zip(
 ) -> Generator[tuple[zipfile.ZipInfo, IO[Any]], None, None]:
     with zipfile.ZipFile(zip_location, "r") as zip_file:
         for file_info in zip_file.infolist():
-            with zip_file.open(file_info.filename, "r") as file:
-                if ignore_dirs and file_info.is_dir():
-                    continue
-
-                if ignore_macos_resource_fork_files and is_macos_resource_fork_file(
-                    file_info.filename
-                ):
-                    continue
+            if ignore_dirs and file_info.is_dir():
+                continue
+
+            if ignore_macos_resource_fork_files and is_macos_resource_fork_file(
+                file_info.filename
+            ):
+                continue
+
+            # entries are decompressed as they are read rather than all up front
+            with zip_file.open(file_info, "r") as file:
                 yield file_info, file
 
 
 def read_file(file_reader: IO[Any]) -> tuple[str, dict[str, Any]]:
     metadata = {}
-    file_content_raw = ""
+    lines: list[str] = []
     for ind, line in enumerate(file_reader):
         if isinstance(line, bytes):
             line = line.decode("utf-8")
@@ -77,6 +96,6 @@ def read_file(file_reader: IO[Any]) -> tuple[str, dict[str, Any]]:
         if ind == 0 and line.startswith(_METADATA_FLAG):
             metadata = json.loads(line.replace(_METADATA_FLAG, "", 1).strip())
         else:
-            file_content_raw += line
+            lines.append(line)
 
-    return file_content_raw, metadata
+    return "".join(lines), metadata
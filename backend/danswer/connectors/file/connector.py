@@ -1,5 +1,7 @@
+import io
 import os
 from collections.abc import Generator
+from collections.abc import Iterator
 from datetime import datetime
 from datetime import timezone
 from pathlib import Path
@@ -10,13 +12,14 @@ from danswer.configs.app_configs import INDEX_BATCH_SIZE
 from danswer.configs.constants import DocumentSource
 from danswer.connectors.cross_connector_utils.file_utils import load_files_from_zip
 from danswer.connectors.cross_connector_utils.file_utils import read_file
-from danswer.connectors.cross_connector_utils.file_utils import read_pdf_file
+from danswer.connectors.cross_connector_utils.file_utils import read_pdf_file_pages
 from danswer.connectors.file.utils import check_file_ext_is_valid
 from danswer.connectors.file.utils import get_file_ext
 from danswer.connectors.interfaces import GenerateDocumentsOutput
 from danswer.connectors.interfaces import LoadConnector
 from danswer.connectors.models import Document
 from danswer.connectors.models import Section
+from danswer.utils.batching import batch_generator
 from danswer.utils.logger import setup_logger
 
 
@@ -25,18 +28,24 @@ logger = setup_logger()
 
 def _open_files_at_location(
     file_path: str | Path,
-) -> Generator[tuple[str, IO[Any]], Any, None]:
+) -> Generator[tuple[str, IO[Any], bool], Any, None]:
+    """Yields the name of each file, the opened file and whether the file is empty"""
     extension = get_file_ext(file_path)
 
     if extension == ".zip":
         for file_info, file in load_files_from_zip(file_path, ignore_dirs=True):
-            yield file_info.filename, file
+            if get_file_ext(file_info.filename) == ".pdf":
+                # pypdf seeks around the file and seeking backwards in a compressed
+                # zip entry means decompressing it again, so PDFs are read into
+                # memory first. Text files are read line by line straight from the zip
+                file = io.BytesIO(file.read())
+            yield file_info.filename, file, file_info.file_size == 0
     elif extension == ".txt" or extension == ".pdf":
         mode = "r"
         if extension == ".pdf":
             mode = "rb"
         with open(file_path, mode) as file:
-            yield os.path.basename(file_path), file
+            yield os.path.basename(file_path), file, os.path.getsize(file_path) == 0
     else:
         logger.warning(f"Skipping file '{file_path}' with extension '{extension}'")
 
@@ -46,25 +55,38 @@ def _process_file(
     file: IO[Any],
     time_updated: datetime,
     pdf_pass: str | None = None,
+    is_empty: bool = False,
 ) -> list[Document]:
     extension = get_file_ext(file_name)
     if not check_file_ext_is_valid(extension):
         logger.warning(f"Skipping file '{file_name}' with extension '{extension}'")
         return []
 
-    metadata: dict[str, Any] = {}
-
-    if extension == ".pdf":
-        file_content_raw = read_pdf_file(
-            file=file, file_name=file_name, pdf_pass=pdf_pass
-        )
+    if is_empty:
+        # Nothing to parse (and pypdf raises on empty files), but by user request
+        # keep the file so it's still discoverable by title
+        sections = [Section(link="", text="")]
+    elif extension == ".pdf":
+        # One section per page, avoids building the full document text as one string
+        sections = [
+            Section(link="", text=page_text)
+            for page_text in read_pdf_file_pages(
+                file=file, file_name=file_name, pdf_pass=pdf_pass
+            )
+            if page_text
+        ]
+        # By user request, keep files that are unreadable just so they
+        # can be discoverable by title.
+        if not sections:
+            sections = [Section(link="", text="")]
     else:
         file_content_raw, metadata = read_file(file)
+        sections = [Section(link=metadata.get("link", ""), text=file_content_raw)]
 
     return [
         Document(
             id=file_name,
-            sections=[Section(link=metadata.get("link", ""), text=file_content_raw)],
+            sections=sections,
             source=DocumentSource.FILE,
             semantic_identifier=file_name,
             doc_updated_at=time_updated,
@@ -87,23 +109,18 @@ class LocalFileConnector(LoadConnector):
         self.pdf_pass = credentials.get("pdf_password")
         return None
 
-    def load_from_state(self) -> GenerateDocumentsOutput:
-        documents: list[Document] = []
+    def _load_documents(self) -> Iterator[Document]:
         for file_location in self.file_locations:
             current_datetime = datetime.now(timezone.utc)
             files = _open_files_at_location(file_location)
 
-            for file_name, file in files:
-                documents.extend(
-                    _process_file(file_name, file, current_datetime, self.pdf_pass)
+            for file_name, file, is_empty in files:
+                yield from _process_file(
+                    file_name, file, current_datetime, self.pdf_pass, is_empty
                 )
 
-                if len(documents) >= self.batch_size:
-                    yield documents
-                    documents = []
-
-        if documents:
-            yield documents
+    def load_from_state(self) -> GenerateDocumentsOutput:
+        yield from batch_generator(self._load_documents(), self.batch_size)
 
 
 if __name__ == "__main__":
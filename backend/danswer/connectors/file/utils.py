@@ -13,7 +13,8 @@ _VALID_FILE_EXTENSIONS = [".txt", ".zip", ".pdf"]
 
 def get_file_ext(file_path_or_name: str | Path) -> str:
     _, extension = os.path.splitext(file_path_or_name)
-    return extension
+    # so that files like `report.PDF` are handled the same as `report.pdf`
+    return extension.lower()
 
 
 def check_file_ext_is_valid(ext: str) -> bool:
@@ -14,13 +14,13 @@ class ConnectorMissingCredentialError(PermissionError):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Section:
     link: str
     text: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Document:
     id: str  # This must be unique or during indexing/reindexing, chunks will be overwritten
     sections: list[Section]
@@ -1,6 +1,7 @@
 from collections.abc import Sequence
 
 from sqlalchemy import select
+from sqlalchemy.orm import joinedload
 from sqlalchemy.orm import Session
 
 from danswer.db.chat import upsert_persona
@@ -147,4 +148,15 @@ def remove_slack_bot_config(
 
 
 def fetch_slack_bot_configs(db_session: Session) -> Sequence[SlackBotConfig]:
-    return db_session.scalars(select(SlackBotConfig)).all()
+    # The Slack bot fetches these for every message it receives and then needs the
+    # document sets of the matched config, load everything in a single query rather
+    # than lazily one query at a time
+    return (
+        db_session.scalars(
+            select(SlackBotConfig).options(
+                joinedload(SlackBotConfig.persona).joinedload(Persona.document_sets)
+            )
+        )
+        .unique()
+        .all()
+    )
@@ -70,28 +70,33 @@ def semantic_reranking(
     model_max: int = CROSS_ENCODER_RANGE_MAX,
 ) -> list[InferenceChunk]:
     cross_encoders = get_default_reranking_model_ensemble()
-    sim_scores = [
-        encoder.predict([(query, chunk.content) for chunk in chunks])  # type: ignore
-        for encoder in cross_encoders
-    ]
+    # shape (num encoders, num chunks)
+    sim_scores = numpy.stack(
+        [
+            encoder.predict([(query, chunk.content) for chunk in chunks])  # type: ignore
+            for encoder in cross_encoders
+        ]
+    )
 
-    raw_sim_scores = sum(sim_scores) / len(sim_scores)
+    raw_sim_scores = sim_scores.mean(axis=0)
 
-    cross_models_min = numpy.min(sim_scores)
+    cross_models_min = sim_scores.min()
 
-    shifted_sim_scores = sum(
-        [enc_n_scores - cross_models_min for enc_n_scores in sim_scores]
-    ) / len(sim_scores)
+    shifted_sim_scores = (sim_scores - cross_models_min).mean(axis=0)
 
-    boosts = [translate_boost_count_to_multiplier(chunk.boost) for chunk in chunks]
-    recency_multiplier = [chunk.recency_bias for chunk in chunks]
+    boosts = numpy.array(
+        [translate_boost_count_to_multiplier(chunk.boost) for chunk in chunks]
+    )
+    recency_multiplier = numpy.array([chunk.recency_bias for chunk in chunks])
     boosted_sim_scores = shifted_sim_scores * boosts * recency_multiplier
     normalized_b_s_scores = (boosted_sim_scores + cross_models_min - model_min) / (
         model_max - model_min
     )
-    scored_results = list(zip(normalized_b_s_scores, raw_sim_scores, chunks))
-    scored_results.sort(key=lambda x: x[0], reverse=True)
-    ranked_sim_scores, ranked_raw_scores, ranked_chunks = zip(*scored_results)
+    # stable sort so that ties keep their original retrieval order
+    ranking = numpy.argsort(-normalized_b_s_scores, kind="stable")
+    ranked_sim_scores = normalized_b_s_scores[ranking].tolist()
+    ranked_raw_scores = raw_sim_scores[ranking].tolist()
+    ranked_chunks = [chunks[ind] for ind in ranking]
 
     logger.debug(f"Reranked similarity scores: {ranked_sim_scores}")
 
@@ -117,7 +122,7 @@ def semantic_reranking(
             )
         )
 
-    return list(ranked_chunks)
+    return ranked_chunks
 
 
 def apply_boost(
@@ -125,51 +130,42 @@ def apply_boost(
     norm_min: float = SIM_SCORE_RANGE_LOW,
     norm_max: float = SIM_SCORE_RANGE_HIGH,
 ) -> list[InferenceChunk]:
-    scores = [chunk.score or 0 for chunk in chunks]
-    boosts = [translate_boost_count_to_multiplier(chunk.boost) for chunk in chunks]
+    scores = numpy.array([chunk.score or 0 for chunk in chunks], dtype=float)
+    boosts = numpy.array(
+        [translate_boost_count_to_multiplier(chunk.boost) for chunk in chunks]
+    )
 
-    logger.debug(f"Raw similarity scores: {scores}")
+    logger.debug(f"Raw similarity scores: {scores.tolist()}")
 
-    score_min = min(scores)
-    score_max = max(scores)
+    score_min = scores.min()
+    score_max = scores.max()
     score_range = score_max - score_min
 
     if score_range != 0:
-        boosted_scores = [
-            ((score - score_min) / score_range) * boost
-            for score, boost in zip(scores, boosts)
-        ]
-        unnormed_boosted_scores = [
-            score * score_range + score_min for score in boosted_scores
-        ]
+        boosted_scores = ((scores - score_min) / score_range) * boosts
+        unnormed_boosted_scores = boosted_scores * score_range + score_min
     else:
-        unnormed_boosted_scores = [
-            score * boost for score, boost in zip(scores, boosts)
-        ]
+        unnormed_boosted_scores = scores * boosts
 
-    norm_min = min(norm_min, min(scores))
-    norm_max = max(norm_max, max(scores))
+    norm_min = min(norm_min, score_min)
+    norm_max = max(norm_max, score_max)
     # This should never be 0 unless user has done some weird/wrong settings
     norm_range = norm_max - norm_min
 
     # For score display purposes
     if norm_range != 0:
-        re_normed_scores = [
-            ((score - norm_min) / norm_range) for score in unnormed_boosted_scores
-        ]
+        re_normed_scores = (unnormed_boosted_scores - norm_min) / norm_range
     else:
         re_normed_scores = unnormed_boosted_scores
 
-    rescored_chunks = list(zip(re_normed_scores, chunks))
-    rescored_chunks.sort(key=lambda x: x[0], reverse=True)
-    sorted_boosted_scores, boost_sorted_chunks = zip(*rescored_chunks)
-
-    final_chunks = list(boost_sorted_chunks)
-    final_scores = list(sorted_boosted_scores)
+    # stable sort so that ties keep their original retrieval order
+    ranking = numpy.argsort(-re_normed_scores, kind="stable")
+    final_chunks = [chunks[ind] for ind in ranking]
+    final_scores = re_normed_scores[ranking].tolist()
     for ind, chunk in enumerate(final_chunks):
         chunk.score = final_scores[ind]
 
-    logger.debug(f"Boost sorted similary scores: {list(final_scores)}")
+    logger.debug(f"Boost sorted similary scores: {final_scores}")
 
     return final_chunks
 
@@ -0,0 +1,124 @@
+import unittest
+from typing import Any
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+from danswer.bots.slack.handlers.handle_message import handle_message
+from danswer.bots.slack.models import SlackMessageInfo
+from danswer.bots.slack.semantic_cache import SlackQASemanticCache
+from danswer.search.models import QueryFlow
+from danswer.search.models import SearchType
+from danswer.server.models import QAResponse
+from danswer.server.models import SearchDoc
+
+_MODULE = "danswer.bots.slack.handlers.handle_message"
+
+
+def _build_answer(query_event_id: int) -> QAResponse:
+    return QAResponse(
+        answer="Use the reset link on the login page",
+        quotes=None,
+        top_ranked_docs=[
+            SearchDoc(
+                document_id="doc-1",
+                semantic_identifier="Password Reset",
+                link=None,
+                blurb="blurb",
+                source_type="file",
+                boost=0,
+                hidden=False,
+                score=1.0,
+                match_highlights=[],
+            )
+        ],
+        lower_ranked_docs=None,
+        predicted_flow=QueryFlow.QUESTION_ANSWER,
+        predicted_search=SearchType.SEMANTIC,
+        query_event_id=query_event_id,
+        time_cutoff=None,
+        favor_recent=False,
+    )
+
+
+def _build_message_info(msg: str) -> SlackMessageInfo:
+    return SlackMessageInfo(
+        msg_content=msg,
+        channel_to_respond="C123",
+        msg_to_respond="1700000000.000100",
+        sender="U123",
+        bipass_filters=False,
+        is_bot_msg=False,
+    )
+
+
+class TestHandleMessageQACache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.answer_qa_query = MagicMock(return_value=_build_answer(query_event_id=1))
+        self.create_query_event = MagicMock(return_value=2)
+        self.build_documents_blocks = MagicMock(return_value=[])
+        patches: dict[str, Any] = {
+            "embed_query": MagicMock(return_value=[1.0, 0.0]),
+            "get_slack_qa_cache": MagicMock(
+                return_value=SlackQASemanticCache(
+                    max_size=4, ttl_seconds=60, similarity_threshold=0.95
+                )
+            ),
+            "answer_qa_query": self.answer_qa_query,
+            "create_query_event": self.create_query_event,
+            "build_documents_blocks": self.build_documents_blocks,
+            "build_qa_response_blocks": MagicMock(return_value=[]),
+            "get_sqlalchemy_engine": MagicMock(),
+            "Session": MagicMock(),
+            "send_msg_ack_to_user": MagicMock(return_value=None),
+            "remove_react": MagicMock(return_value=None),
+            "respond_in_thread": MagicMock(),
+        }
+        for name, mock in patches.items():
+            patcher = patch(f"{_MODULE}.{name}", mock)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _handle(self, msg: str, reflexion: bool = False) -> bool:
+        return handle_message(
+            message_info=_build_message_info(msg),
+            channel_config=None,
+            client=MagicMock(),
+            should_respond_with_error_msgs=False,
+            disable_docs_only_answer=False,
+            disable_auto_detect_filters=False,
+            reflexion=reflexion,
+            enable_qa_cache=True,
+        )
+
+    def test_cache_hit_gets_its_own_query_event(self) -> None:
+        self.assertFalse(self._handle("How do I reset my password?"))
+        self.assertFalse(self._handle("how do i reset my password"))
+
+        self.answer_qa_query.assert_called_once()
+        self.create_query_event.assert_called_once()
+        self.assertEqual(
+            self.create_query_event.call_args.kwargs["query"],
+            "how do i reset my password",
+        )
+        self.assertEqual(
+            self.create_query_event.call_args.kwargs["retrieved_document_ids"],
+            ["doc-1"],
+        )
+
+        # feedback buttons on each answer point at that question's own query event
+        first_call, second_call = self.build_documents_blocks.call_args_list
+        self.assertEqual(first_call.kwargs["query_event_id"], 1)
+        self.assertEqual(second_call.kwargs["query_event_id"], 2)
+        # and the cached answer itself is left untouched
+        self.assertEqual(self.answer_qa_query.return_value.query_event_id, 1)
+
+    def test_answer_filters_are_part_of_cache_scope(self) -> None:
+        self._handle("How do I reset my password?", reflexion=False)
+        self._handle("How do I reset my password?", reflexion=True)
+
+        self.assertEqual(self.answer_qa_query.call_count, 2)
+        self.create_query_event.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+import unittest
+from typing import cast
+
+from danswer.bots.slack.semantic_cache import SlackQASemanticCache
+from danswer.server.models import QAResponse
+
+
+class TestSlackQASemanticCache(unittest.TestCase):
+    def test_similar_query_hits(self) -> None:
+        cache = SlackQASemanticCache(
+            max_size=4, ttl_seconds=60, similarity_threshold=0.95
+        )
+        response = cast(QAResponse, "answer")
+        cache.put([1.0, 0.0, 0.0], ("docs",), response)
+
+        self.assertIs(cache.get([0.99, 0.01, 0.0], ("docs",)), response)
+        self.assertIsNone(cache.get([0.0, 1.0, 0.0], ("docs",)))
+        # same query but restricted to different document sets
+        self.assertIsNone(cache.get([1.0, 0.0, 0.0], ("other-docs",)))
+
+    def test_expired_entries_miss(self) -> None:
+        cache = SlackQASemanticCache(
+            max_size=4, ttl_seconds=0, similarity_threshold=0.95
+        )
+        cache.put([1.0, 0.0], (), cast(QAResponse, "answer"))
+
+        self.assertIsNone(cache.get([1.0, 0.0], ()))
+
+    def test_least_recently_used_is_evicted(self) -> None:
+        cache = SlackQASemanticCache(
+            max_size=2, ttl_seconds=60, similarity_threshold=0.95
+        )
+        cache.put([1.0, 0.0, 0.0], (), cast(QAResponse, "first"))
+        cache.put([0.0, 1.0, 0.0], (), cast(QAResponse, "second"))
+        # touch the first entry so the second one becomes the LRU entry
+        cache.get([1.0, 0.0, 0.0], ())
+        cache.put([0.0, 0.0, 1.0], (), cast(QAResponse, "third"))
+
+        self.assertEqual(cache.get([1.0, 0.0, 0.0], ()), "first")
+        self.assertIsNone(cache.get([0.0, 1.0, 0.0], ()))
+        self.assertEqual(cache.get([0.0, 0.0, 1.0], ()), "third")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+import unittest
+from typing import Any
+from unittest.mock import MagicMock
+
+from danswer.bots.slack.utils import _TTLCache
+from danswer.bots.slack.utils import fetch_userids_from_emails_cached
+
+
+class TestTTLCache(unittest.TestCase):
+    def test_cached_value_is_reused(self) -> None:
+        cache: _TTLCache[str, int] = _TTLCache(max_size=2, ttl_seconds=60)
+        calls: list[str] = []
+
+        def _compute() -> int:
+            calls.append("called")
+            return 1
+
+        self.assertEqual(cache.get_or_compute("a", _compute), 1)
+        self.assertEqual(cache.get_or_compute("a", _compute), 1)
+        self.assertEqual(len(calls), 1)
+
+    def test_expired_entries_are_recomputed(self) -> None:
+        cache: _TTLCache[str, int] = _TTLCache(max_size=2, ttl_seconds=0)
+        cache.get_or_compute("a", lambda: 1)
+
+        self.assertEqual(cache.get_or_compute("a", lambda: 2), 2)
+
+    def test_least_recently_used_is_evicted(self) -> None:
+        cache: _TTLCache[str, int] = _TTLCache(max_size=2, ttl_seconds=60)
+        cache.get_or_compute("a", lambda: 1)
+        cache.get_or_compute("b", lambda: 2)
+        # touch "a" so that "b" becomes the least recently used entry
+        cache.get_or_compute("a", lambda: -1)
+        cache.get_or_compute("c", lambda: 3)
+
+        self.assertEqual(cache.get_or_compute("a", lambda: -1), 1)
+        self.assertEqual(cache.get_or_compute("c", lambda: -1), 3)
+        self.assertEqual(cache.get_or_compute("b", lambda: -1), -1)
+
+    def test_nothing_cached_when_compute_raises(self) -> None:
+        cache: _TTLCache[str, int] = _TTLCache(max_size=2, ttl_seconds=60)
+
+        def _fail() -> int:
+            raise RuntimeError("Slack is down")
+
+        with self.assertRaises(RuntimeError):
+            cache.get_or_compute("a", _fail)
+        self.assertEqual(cache.get_or_compute("a", lambda: 1), 1)
+
+    def test_nothing_cached_when_should_cache_rejects(self) -> None:
+        cache: _TTLCache[str, list[str]] = _TTLCache(max_size=2, ttl_seconds=60)
+        cache.get_or_compute(
+            "a", lambda: ["U1"], should_cache=lambda ids: len(ids) == 2
+        )
+
+        self.assertEqual(cache.get_or_compute("a", lambda: ["U1", "U2"]), ["U1", "U2"])
+
+
+class TestFetchUserIdsFromEmailsCached(unittest.TestCase):
+    def test_partial_lookup_failure_is_not_cached(self) -> None:
+        lookups_failing = True
+
+        def _lookup(email: str) -> Any:
+            if email == "b@example.com" and lookups_failing:
+                raise RuntimeError("Temporary failure")
+            return MagicMock(data={"user": {"id": f"U-{email}"}})
+
+        client = MagicMock()
+        client.users_lookupByEmail.side_effect = _lookup
+        emails = ["a@example.com", "b@example.com"]
+
+        self.assertEqual(
+            fetch_userids_from_emails_cached(emails, client), ["U-a@example.com"]
+        )
+        lookups_failing = False
+        self.assertEqual(
+            fetch_userids_from_emails_cached(emails, client),
+            ["U-a@example.com", "U-b@example.com"],
+        )
+        # everything resolved, so now served from the cache
+        fetch_userids_from_emails_cached(emails, client)
+        self.assertEqual(client.users_lookupByEmail.call_count, 4)
+
+
+if __name__ == "__main__":
+    unittest.main()